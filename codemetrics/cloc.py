@@ -5,6 +5,7 @@
 
 import csv
 import dataclasses
+import operator
 import pathlib as pl
 
 import pandas as pd
@@ -69,9 +70,11 @@ def get_cloc(
         )
         cloc_entries.append(cloc_entry)
     columns = [f.name for f in dataclasses.fields(ClocEntry)]
+    # dataclasses.astuple deep copies each field, plain attribute access is enough.
+    astuple = operator.attrgetter(*columns)
     cloc = (
         pd.DataFrame.from_records(
-            (dataclasses.astuple(ce) for ce in cloc_entries),
+            (astuple(ce) for ce in cloc_entries),
             columns=columns,
         )
         .rename(
@@ -83,9 +83,10 @@ def get_ages(
     if by is None:
         by = ["path"]
     now = pd.to_datetime(internals.get_now(), utc=True)
-    rv = data.groupby(by)["date"].max().reset_index()
-    rv["age"] = now - pd.to_datetime(rv["date"], utc=True)
-    rv["age"] /= pd.Timedelta(1, unit="D")
+    # Categorical keys like kind may carry unused categories once the log is
+    # filtered: observed=True keeps the groups to the combinations in data.
+    rv = data.groupby(by, observed=True)["date"].max().reset_index()
+    rv["age"] = (now - pd.to_datetime(rv["date"], utc=True)) / pd.Timedelta(1, "D")
     return rv.drop(columns=["date"])
 
 
@@ -145,16 +146,21 @@ def get_co_changes(log=None, by=None, on=None):
     if on is None:
         on = "revision"
     df = log[[on, by]].drop_duplicates()
-    sj = (
-        pd.merge(df, df, on=on)
-        .rename(columns={by + "_x": by, by + "_y": "dependency"})
+    # Number of distinct `on` per `by` is the diagonal of the self-join: count
+    # it on df instead of grouping the whole self-join.
+    changes = df.groupby(by).size().reset_index(name="changes")
+    pairs = pd.merge(df, df, on=on).rename(
+        columns={by + "_x": by, by + "_y": "dependency"}
+    )
+    cochanges = (
+        pairs[pairs[by] != pairs["dependency"]]
         .groupby([by, "dependency"])
-        .count()
-        .reset_index()
+        .size()
+        .reset_index(name="cochanges")
     )
-    result = pd.merge(
-        sj[sj[by] == sj["dependency"]][[by, on]], sj[sj[by] != sj["dependency"]], on=by
-    ).rename(columns={on + "_x": "changes", on + "_y": "cochanges"})
+    # Categorical keys yield all the combinations, including the diagonal.
+    cochanges = cochanges[cochanges[by] != cochanges["dependency"]]
+    result = pd.merge(changes, cochanges, on=by)
     result["coupling"] = result["cochanges"] / result["changes"]
     return result[[by, "dependency", "changes", "cochanges", "coupling"]].sort_values(
         by="coupling", ascending=False
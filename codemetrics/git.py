@@ -4,8 +4,10 @@
 """Git related functions."""
 
 import datetime as dt
+import io
 import pathlib as pl
 import re
+import subprocess
 import typing
 
 import numpy as np
@@ -54,19 +56,21 @@ class _GitLogCollector(scm.ScmLogCollector):
             rel_path and copy_from_path where copy_from_path can be None.
 
         """
-        try:
-            left, right = path_info.split(" => ")
-            try:
-                prefix, copy_from_path = left.split("{")
-                rel_path, suffix = right.split("}")
-                copy_from_path = (prefix + copy_from_path + suffix).replace("//", "/")
-                rel_path = (prefix + rel_path + suffix).replace("//", "/")
-            except ValueError:  # no braces implies no prefix or suffix
-                copy_from_path = left
-                rel_path = right
-        except ValueError:  # => was not found, no copy from.
-            rel_path = path_info
-            copy_from_path = None
+        # Most paths are not moves: test before splitting rather than relying
+        # on exceptions which are comparatively expensive.
+        moved = path_info.split(" => ") if " => " in path_info else ()
+        if len(moved) != 2:  # => was not found, no copy from.
+            return path_info, None
+        left, right = moved
+        lefts = left.split("{")
+        rights = right.split("}")
+        if len(lefts) != 2 or len(rights) != 2:
+            # no braces implies no prefix or suffix
+            return right, left
+        prefix, copy_from_path = lefts
+        rel_path, suffix = rights
+        copy_from_path = (prefix + copy_from_path + suffix).replace("//", "/")
+        rel_path = (prefix + rel_path + suffix).replace("//", "/")
         return rel_path, copy_from_path
 
     def parse_path_elem(self, path_elem: str):
@@ -212,7 +216,8 @@ class _GitLogCollector(scm.ScmLogCollector):
             import pdb
 
             pdb.set_trace()
-        results = internals.run(command, cwd=self.cwd).split("\n")
+        # Parse the log as git writes it rather than after it completes.
+        results = internals.run_streaming(command, cwd=self.cwd)
         return self.process_log_output_to_df(
             results, after=after, progress_bar=progress_bar
         )
@@ -240,6 +245,98 @@ class _GitFileDownloader(scm.ScmDownloader):
         content = internals.run(command, cwd=self.cwd)
         return scm.DownloadResult(revision, path, content)
 
+    def _open_batch(self) -> subprocess.Popen:
+        """Start a `git cat-file --batch` process.
+
+        Raise:
+            ValueError if git cannot be started.
+
+        """
+        command = [self.command[0], "cat-file", "--batch"]
+        cwd = pl.Path(self.cwd or ".").absolute()
+        log.info(" ".join(command) + f" (in {cwd})")
+        try:
+            return subprocess.Popen(
+                command,
+                shell=False,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.cwd,
+            )
+        except OSError as err:
+            raise ValueError(f"failed to execute {' '.join(command)}: {err}")
+
+    @staticmethod
+    def _cat_file(
+        process: subprocess.Popen, revision: str, path: str
+    ) -> typing.Optional[str]:
+        """Request revision:path to a `git cat-file --batch` process.
+
+        Returns:
+            content of the file or None if revision:path is not a file or git
+            is not answering.
+
+        """
+        assert process.stdin is not None and process.stdout is not None
+        try:
+            process.stdin.write(f"{revision}:{path}\n".encode())
+            process.stdin.flush()
+        except OSError:  # git exited.
+            return None
+        # A file is answered with exactly 3 fields: <sha> <type> <size>.
+        # Anything else (e.g. <object> missing) has no content to read.
+        header = process.stdout.readline().split()
+        if len(header) != 3 or not header[2].isdigit():
+            return None
+        size = int(header[2])
+        data = process.stdout.read(size + 1)[:size]
+        if header[1] != b"blob":
+            return None
+        # Decode like internals.run: locale encoding and universal newlines.
+        return io.TextIOWrapper(io.BytesIO(data), errors="ignore").read()
+
+    def download_batch(
+        self, pairs: typing.Iterable[typing.Tuple[str, str]]
+    ) -> typing.List[scm.DownloadResult]:
+        """Download several files with a single git process.
+
+        Files are read from one `git cat-file --batch` process instead of
+        running `git show` for each of them. Anything that is not a file in
+        the repository (e.g. deleted path) is passed on to `download` so the
+        results are the same as downloading the files one by one.
+
+        Args:
+            pairs: (revision, path) of each file to download.
+
+        Returns:
+            list of scm.DownloadResult in the order of pairs.
+
+        """
+        pairs = list(pairs)
+        try:
+            process = self._open_batch()
+        except ValueError:
+            return [self.download(revision, path) for revision, path in pairs]
+        results = []
+        with process:
+            for revision, path in pairs:
+                content = None
+                if revision and path and "\n" not in path:
+                    content = self._cat_file(process, revision, path)
+                if content is None:
+                    results.append(self.download(revision, path))
+                else:
+                    results.append(scm.DownloadResult(revision, path, content))
+            # Close stdin here: if git exited, the data left in the buffer
+            # would make Popen.__exit__ raise BrokenPipeError.
+            assert process.stdin is not None
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        return results
+
 
 class GitProject(scm.Project):
 
@@ -273,6 +370,19 @@ class GitProject(scm.Project):
         revision, path = next(df.itertuples(index=False))
         return downloader.download(revision, path)
 
+    def download_many(self, data: pd.DataFrame) -> typing.List[scm.DownloadResult]:
+        """Download the file identified by each row of data from Git.
+
+        Args:
+            data: pd.DataFrame containing at least revision and path.
+
+        Returns:
+            list of DownloadResult in the order of the rows of data.
+
+        """
+        downloader = _GitFileDownloader(git_client=self.client, cwd=self.cwd)
+        return downloader.download_batch(zip(data["revision"], data["path"]))
+
     def get_log(
         self,
         path: str = ".",
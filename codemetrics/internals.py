@@ -7,6 +7,7 @@ import datetime as dt
 import logging
 import pathlib as pl
 import subprocess
+import tempfile
 import typing
 
 import pandas as pd
@@ -123,6 +124,61 @@ def run(cmd_list: typing.List[str], **kwargs) -> str:
     return result.stdout  # No split. See __doc__.
 
 
+def run_streaming(
+    cmd_list: typing.List[str], **kwargs
+) -> typing.Generator[str, None, None]:
+    """Execute command passed as argument and yield its output line by line.
+
+    Same as `run` but lines are yielded as the command writes them instead of
+    waiting for the command to finish, so the whole output is never held in
+    memory and can be parsed while the command is still running.
+
+    The command only starts when the first line is requested.
+
+    Args:
+        cmd_list: command to execute.
+        **kwargs: additional kwargs are passed to subprocess.Popen(). In
+        particular:
+        cwd: path in which to execute the command.
+
+    Yields:
+        Lines of output of the command without the trailing end of line.
+
+    Raise:
+        ValueError if the command is not executed properly.
+
+    """
+    if "errors" not in kwargs:
+        kwargs["errors"] = "ignore"
+    cwd = pl.Path(kwargs.get("cwd", ".")).absolute()
+    command = " ".join(cmd_list) + f" (in {cwd})"
+    log.info(command)
+    # stderr goes to a file so a verbose command cannot block on a full pipe
+    # while stdout is being consumed.
+    with tempfile.TemporaryFile("w+", errors=kwargs["errors"]) as stderr:
+        try:
+            process = subprocess.Popen(
+                cmd_list,
+                shell=False,  # see https://security.openstack.org/guidelines/dg_avoid-shell-true.html
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                **kwargs,
+            )
+        except FileNotFoundError:
+            raise ValueError(f"failed to execute {command}: file not found")
+        with process:
+            assert process.stdout is not None
+            try:
+                for line in process.stdout:
+                    yield line.rstrip("\n")
+            except BaseException:  # Includes GeneratorExit if not exhausted.
+                process.kill()
+                raise
+        if process.returncode:
+            stderr.seek(0)
+            raise ValueError(f"failed to execute {command}: {stderr.read()}")
+
+
 def handle_default_dates(
     after: typing.Optional[dt.datetime], before: typing.Optional[dt.datetime]
 ) -> typing.Tuple[dt.datetime, typing.Optional[dt.datetime]]:
@@ -6,6 +6,7 @@
 import abc
 import collections
 import datetime as dt
+import operator
 import pathlib as pl
 import re
 import typing
@@ -49,6 +50,21 @@ class Project(abc.ABC):
     def download(self, data: pd.DataFrame) -> DownloadResult:
         pass
 
+    def download_many(self, data: pd.DataFrame) -> typing.List[DownloadResult]:
+        """Download the file identified by each row of data.
+
+        Equivalent to ``data.apply(project.download, axis=1).tolist()``.
+        Subclasses override it to avoid the per row overhead.
+
+        Args:
+            data: pd.DataFrame containing at least revision and path.
+
+        Returns:
+            list of DownloadResult in the order of the rows of data.
+
+        """
+        return [self.download(row) for _, row in data.iterrows()]
+
     @abc.abstractmethod
     def get_log(
         self,
@@ -151,7 +167,10 @@ class LogEntry:
 
     def astuple(self):
         """Return the data as tuple."""
-        return (getattr(self, slot) for slot in self.__slots__)
+        return _log_entry_values(self)
+
+
+_log_entry_values = operator.attrgetter(*LogEntry.__slots__)
 
 
 def normalize_log(df):
@@ -194,7 +213,7 @@ def to_frame(log_entries: typing.Sequence[LogEntry]) -> pd.DataFrame:
     """
     columns = LogEntry.__slots__
     result = pd.DataFrame.from_records(
-        (log_entry.astuple() for log_entry in log_entries), columns=columns
+        [_log_entry_values(log_entry) for log_entry in log_entries], columns=columns
     )
     return normalize_log(result)
 
@@ -230,7 +249,7 @@ class ScmLogCollector(abc.ABC):
 
     def process_log_output_to_df(
         self,
-        cmd_output: typing.Sequence[str],
+        cmd_output: typing.Iterable[str],
         after: dt.datetime,
         progress_bar: tqdm.tqdm = None,
     ):
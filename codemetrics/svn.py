@@ -4,13 +4,18 @@
 """_SvnLogCollector related functions."""
 
 import datetime as dt
+import itertools
 import pathlib as pl
 import re
 import subprocess
 import typing
 
-# noinspection PyPep8Naming,PyPep8Naming
-import xml.etree.ElementTree as ET
+try:
+    # noinspection PyPep8Naming
+    import lxml.etree as ET  # type: ignore
+except ImportError:  # lxml is optional, it only speeds up parsing the log.
+    # noinspection PyPep8Naming
+    import xml.etree.ElementTree as ET
 
 import numpy as np
 import pandas as pd
@@ -30,10 +35,17 @@ def to_date(datestr: str):
 
     added and removed columns are set to np.nan for now.
 
+    Dates formatted like svn log --xml output (e.g. 2018-02-24T11:14:11.000000Z)
+    are parsed with strptime, anything else falls back on dateutil.
+
     """
-    from dateutil import parser
+    try:
+        date = dt.datetime.strptime(datestr, "%Y-%m-%dT%H:%M:%S.%fZ")
+    except ValueError:
+        from dateutil import parser
 
-    return parser.parse(datestr).replace(tzinfo=dt.timezone.utc)
+        date = parser.parse(datestr)
+    return date.replace(tzinfo=dt.timezone.utc)
 
 
 def to_bool(bool_str: str):
@@ -50,6 +62,7 @@ class _SvnLogCollector(scm.ScmLogCollector):
     """_ScmLogCollector interface adapter for _SvnLogCollector."""
 
     _args = "log --xml -v".split()
+    _batch_size = 4096
 
     def __init__(
         self,
@@ -101,15 +114,26 @@ class _SvnLogCollector(scm.ScmLogCollector):
 
     @staticmethod
     def _extract(
-        elem: ET.Element, sub: str, log_entry: str, on_error=None
+        elem: ET.Element, sub: str, where: str, on_error=None
     ) -> typing.Optional[str]:
-        """Extract subelement from element."""
+        """Extract subelement from element.
+
+        Args:
+            elem: <logentry/> element.
+            sub: name of the subelement.
+            where: location of elem reported in warnings (e.g. revision 1).
+            on_error: "raise" to propagate the error instead of returning None.
+
+        Returns:
+            text of the subelement or None if it cannot be found.
+
+        """
         try:
             subel = elem.find(f"./{sub}")
             if subel is not None:
                 return subel.text
         except (AttributeError, SyntaxError) as err:
-            log.warning("failed to retrieve %s in %s: %s", sub, log_entry, err)
+            log.warning("failed to retrieve %s in %s: %s", sub, where, err)
             if on_error == "raise":
                 raise
         return None
@@ -124,11 +148,24 @@ class _SvnLogCollector(scm.ScmLogCollector):
             One or more csv rows.
 
         """
-        elem = ET.fromstring(log_entry)
+        yield from self.process_element(ET.fromstring(log_entry))
+
+    def process_element(self, elem):
+        """Convert a parsed <logentry/> element to csv rows.
+
+        Args:
+            elem: <logentry/> element.
+
+        Yields:
+            One or more csv rows.
+
+        """
         rev = elem.attrib["revision"]
-        author = self._extract(elem, "author", log_entry)
-        date = self._extract(elem, "date", log_entry, "raise")
-        message = self._extract(elem, "msg", log_entry)
+        where = f"revision {rev}"
+        author = self._extract(elem, "author", where)
+        date_str = self._extract(elem, "date", where, "raise")
+        date = to_date(date_str) if date_str is not None else None
+        message = self._extract(elem, "msg", where)
         if message is not None:
             message = message.replace("\n", " ")
         rel_url_slash = self.relative_url + "/"
@@ -158,7 +195,7 @@ class _SvnLogCollector(scm.ScmLogCollector):
             entry = scm.LogEntry(
                 rev,
                 author,
-                to_date(date),
+                date,
                 path=path,
                 message=message,
                 textmods=to_bool(other["text-mods"]),
@@ -174,18 +211,19 @@ class _SvnLogCollector(scm.ScmLogCollector):
 
     def process_log_entries(self, xml):
         # See parent.
-        log_entry = ""
-        for line in xml:
-            if line.startswith("<logentry"):
-                log_entry += line
-                continue
-            if not log_entry:
-                continue
-            log_entry += line
-            if not line.startswith("</logentry>"):
-                continue
-            yield from self.process_entry(log_entry)
-            log_entry = ""
+        # Feed the parser by batches of lines and process each <logentry/> as
+        # soon as it is complete rather than re-parsing it from a string.
+        parser = ET.XMLPullParser(events=("end",))
+        lines = itertools.dropwhile(lambda line: not line.strip(), xml)
+        while True:
+            batch = list(itertools.islice(lines, self._batch_size))
+            if not batch:
+                break
+            parser.feed("\n".join(batch) + "\n")
+            for _, elem in parser.read_events():
+                if elem.tag == "logentry":
+                    yield from self.process_element(elem)
+                    elem.clear()
 
     def get_log(
         self,
@@ -349,6 +387,22 @@ class SvnProject(scm.Project):
         revision, path = next(df.itertuples(index=False))
         return downloader.download(revision, path)
 
+    def download_many(self, data: pd.DataFrame) -> typing.List[scm.DownloadResult]:
+        """Download the file identified by each row of data from Subversion.
+
+        Args:
+            data: pd.DataFrame containing at least revision and path.
+
+        Returns:
+            list of DownloadResult in the order of the rows of data.
+
+        """
+        downloader = SvnDownloader(["cat", "-r"], svn_client=self.client, cwd=self.cwd)
+        return [
+            downloader.download(revision, path)
+            for revision, path in zip(data["revision"], data["path"])
+        ]
+
     def get_log(
         self,
         path: str = ".",
@@ -5,11 +5,48 @@ import json
 import os
 import typing
 
+import numpy as np
 import pandas as pd
 
 from . import internals
 
 
+def _climb(
+    leaves: typing.List[str], get_parent, root: str, max_iter: int
+) -> typing.Tuple[typing.List[str], typing.List[typing.Optional[str]], bool]:
+    """Walk up the hierarchy one level at a time from the leaves.
+
+    Each level is a plain list so the walk does not pay for a DataFrame per
+    level. Nodes are listed in the order they are discovered and the root is
+    appended last with a None parent once every branch reached it.
+
+    Returns:
+        names and parents of the nodes and whether root was found as a parent.
+
+    """
+    names: typing.List[str] = []
+    parents: typing.List[typing.Optional[str]] = []
+    seen = {root}
+    root_actually_seen = False
+    level = leaves
+    for _ in range(max_iter):
+        level_parents = [get_parent(name) for name in level]
+        names.extend(level)
+        parents.extend(level_parents)
+        level = []
+        for name in level_parents:
+            if name == root:
+                root_actually_seen = True
+            if name not in seen:
+                seen.add(name)
+                level.append(name)
+        if not level:
+            names.append(root)
+            parents.append(None)
+            break
+    return names, parents, root_actually_seen
+
+
 def build_hierarchy(
     data: pd.DataFrame,
     get_parent=os.path.dirname,
@@ -42,42 +79,38 @@ def build_hierarchy(
     if not col_name:
         col_name = data.columns[0]
     parent = get_parent.__name__
-    df = data[[col_name]]
-    frames = []
-    seen = {root}
-    root_actually_seen = False
-    count = 0
-    for _ in range(max_iter):
-        df.loc[:, parent] = df[col_name].apply(get_parent)
-        if root in df[parent].values:
-            root_actually_seen = True
-        df["id"] = range(count, count + len(df))
-        count += len(df)
-        frames.append(df)
-        df = (
-            df.loc[~df[parent].isin(seen), [parent]]
-            .drop_duplicates()
-            .rename(columns={parent: col_name})
-        )
-        seen.update(df[col_name])
-        if len(df) == 0:
-            frames.append(
-                pd.DataFrame(data={"id": [count], col_name: [root], parent: [None]})
-            )
-            break
+    names, parents, root_actually_seen = _climb(
+        data[col_name].tolist(), get_parent, root, max_iter
+    )
     if not root_actually_seen:
         msg = f"cannot find root {root} in input frame"
         internals.log.error(msg)
         raise ValueError(msg)
-    df = pd.concat(frames, sort=False).drop_duplicates()
-    df["id"] = len(df) - df["id"] - 1
+    if all(name == root for name in parents[:-1]):
+        # Every element hangs off the root: same frame without the merge.
+        return pd.DataFrame(
+            {
+                "id": range(len(names)),
+                "parent": [np.nan] + [0.0] * (len(names) - 1),
+                col_name: pd.Series([root, *reversed(names[:-1])], dtype="object"),
+            }
+        )
+    # Rows are distinct by construction, ids count down so that the root is 0.
+    df = pd.DataFrame({col_name: names, parent: parents}, dtype="object")
+    df["id"] = range(len(df) - 1, -1, -1)
     assert col_name is not None
     y_name = col_name + "_y"
     merged = pd.merge(df, df, left_on=col_name, right_on=parent, how="right")[
         [y_name, "id_y", "id_x"]
     ].rename(columns={y_name: col_name, "id_y": "id", "id_x": "parent"})
-    return (
-        merged[["id", "parent", col_name]].sort_values(by="id").reset_index(drop=True)
+    ids = merged["id"].to_numpy()
+    order = np.argsort(ids, kind="stable")
+    return pd.DataFrame(
+        {
+            "id": ids[order],
+            "parent": merged["parent"].to_numpy()[order],
+            col_name: pd.Series(merged[col_name].to_numpy()[order], dtype="object"),
+        }
     )
 
 
@@ -88,6 +121,7 @@ def _vis_generic(
     colorscheme: str,
     height: int = 300,
     width: int = 400,
+    hierarchy: pd.DataFrame = None,
 ) -> dict:
     """Factors common parts of vis_xxx functions.
 
@@ -100,7 +134,8 @@ def _vis_generic(
         raise ValueError(f"{size_column} not found in columns")
     if color_column not in df.columns:
         raise ValueError(f"{color_column} not found in columns")
-    hierarchy = build_hierarchy(df[["path"]], root="")
+    if hierarchy is None:
+        hierarchy = build_hierarchy(df[["path"]], root="")
     hierarchy = (
         pd.merge(hierarchy, df, left_on="path", right_on="path", how="left")
         .rename(columns={size_column: "size", color_column: "intensity"})
@@ -179,6 +214,7 @@ def vis_hot_spots(
     size_column: str = "lines",
     color_column: str = "changes",
     colorscheme: str = "yelloworangered",
+    hierarchy: pd.DataFrame = None,
 ) -> dict:
     """Convert get_hot_spots output to a json vega dict.
 
@@ -189,6 +225,10 @@ def vis_hot_spots(
         size_column: column that drives the size of the circles.
         color_column: column that drives the color intensity of the circles.
         colorscheme: color scheme. See https://vega.github.io/vega/docs/schemes/
+        hierarchy: hierarchy of the paths in df as returned by
+            :func:`build_hierarchy`. Build it once and pass it to visualize
+            the same paths several times without building it again. It is
+            not modified. Defaults to building it from df.
 
     Returns:
         Vega description suitable to be use with Altair.
@@ -214,6 +254,7 @@ def vis_hot_spots(
         colorscheme=colorscheme,
         width=width,
         height=height,
+        hierarchy=hierarchy,
     )
 
 
@@ -222,6 +263,7 @@ def vis_ages(
     height: int = 300,
     width: int = 400,
     colorscheme: str = "greenblue",
+    hierarchy: pd.DataFrame = None,
 ) -> dict:
     """Convert get_ages output to a json vega dict.
 
@@ -230,6 +272,10 @@ def vis_ages(
         height: vertical size of the figure.
         width: horizontal size of the figure.
         colorscheme: color scheme. See https://vega.github.io/vega/docs/schemes/
+        hierarchy: hierarchy of the paths in df as returned by
+            :func:`build_hierarchy`. Build it once and pass it to visualize
+            the same paths several times without building it again. It is
+            not modified. Defaults to building it from df.
 
     Returns:
         Vega description suitable to be use with Altair.
@@ -248,13 +294,12 @@ def vis_ages(
     .. _Vega circle pack example: https://vega.github.io/editor/#/examples/vega/circle-packing
 
     """
-    df["days"] = df["age"].astype("int32")
-    df = df.rename(columns={"code": "loc"})
     return _vis_generic(
-        df,
+        df.rename(columns={"code": "loc"}).assign(days=df["age"].astype("int32")),
         size_column="loc",
         color_column="days",
         colorscheme=colorscheme,
         width=width,
         height=height,
+        hierarchy=hierarchy,
     )
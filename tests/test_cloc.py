@@ -3,7 +3,6 @@
 
 """Tests for loc (lines of code) module."""
 
-import io
 import pathlib as pl
 import textwrap
 import unittest
@@ -19,47 +18,51 @@ from . import utils
 class SimpleDirectory(unittest.TestCase):
     """Given a simple directory."""
 
+    run_output = textwrap.dedent(
+        """\
+    language,filename,blank,comment,code,"http://cloc.sourceforge.net"
+    Python,internals.py,55,50,130
+    Python,tests.py,29,92,109
+    Python,setup.py,4,2,30
+    C#,.NETFramework,Version=v4.7.2.AssemblyAttributes.cs,0,1,3
+    """
+    )
+
     def setUp(self):
         """Mocks the internal run command."""
         utils.add_data_frame_equality_func(self)
-        self.run_output = textwrap.dedent(
-            """\
-        language,filename,blank,comment,code,"http://cloc.sourceforge.net"
-        Python,internals.py,55,50,130
-        Python,tests.py,29,92,109
-        Python,setup.py,4,2,30
-        C#,.NETFramework,Version=v4.7.2.AssemblyAttributes.cs,0,1,3
-        """
-        )
         cmi = "codemetrics.internals."
         self.run_patcher = mock.patch(
             cmi + "run", autospec=True, return_value=self.run_output
         )
         self.check_patcher = mock.patch(cmi + "check_run_in_root", autospec=True)
         self.run_ = self.run_patcher.start()
+        self.addCleanup(self.run_patcher.stop)
         self.check_run_from_root = self.check_patcher.start()
-
-    def tearDown(self):
-        """Turn off patches"""
-        mock.patch.stopall()
+        self.addCleanup(self.check_patcher.stop)
 
     def test_cloc_reads_files(self):
         """cloc is called and reads the output csv file."""
         actual = loc.get_cloc(utils.FakeProject())
         self.run_.assert_called_with("cloc --csv --by-file .".split(), cwd=pl.Path("."))
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """\
-            language,path,blank,comment,code
-            Python,internals.py,55,50,130
-            Python,tests.py,29,92,109
-            Python,setup.py,4,2,30
-            C#,".NETFramework,Version=v4.7.2.AssemblyAttributes.cs",0,1,3
-            """
-                )
-            ),
-            dtype={"path": "string", "language": "string"},
+        expected = pd.DataFrame(
+            {
+                "language": pd.Series(
+                    ["Python", "Python", "Python", "C#"], dtype="string"
+                ),
+                "path": pd.Series(
+                    [
+                        "internals.py",
+                        "tests.py",
+                        "setup.py",
+                        ".NETFramework,Version=v4.7.2.AssemblyAttributes.cs",
+                    ],
+                    dtype="string",
+                ),
+                "blank": [55, 29, 4, 0],
+                "comment": [50, 92, 2, 1],
+                "code": [130, 109, 30, 3],
+            }
         )
         self.assertEqual(expected, actual)
 
@@ -2,6 +2,8 @@
 
 """Tests for cmdline.py."""
 
+import os
+import tempfile
 import textwrap
 import unittest
 import unittest.mock as mock
@@ -14,9 +16,11 @@ from codemetrics import cmdline
 class TestCommandLine(unittest.TestCase):
     """Test command line base class."""
 
-    def setUp(self) -> None:
-        super().setUp()
-        self.runner = testing.CliRunner()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """The runner holds no state between invocations so it is shared."""
+        super().setUpClass()
+        cls.runner = testing.CliRunner()
 
     def invoke(self, *args, **kwargs) -> testing.Result:
         """Forwards call to runner."""
@@ -81,15 +85,27 @@ def write_is_prime(file_name):
 class TestCommandLineOnCppFile(TestCommandLine):
     """Test command line on a sample C++ file."""
 
-    def setUp(self):
-        """Forwards to parent setUp()."""
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):
+        """Write the sample c++ file once for all the tests."""
+        super().setUpClass()
+        cls.tempdir = tempfile.TemporaryDirectory()
+        write_is_prime(os.path.join(cls.tempdir.name, "is_prime.cpp"))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the sample c++ file."""
+        cls.tempdir.cleanup()
+        super().tearDownClass()
 
     def invoke(self, *args, **kwargs) -> testing.Result:
-        """Create a local sample c++ file and calls cli."""
-        with self.runner.isolated_filesystem():
-            write_is_prime("is_prime.cpp")
+        """Calls cli from the directory containing the sample c++ file."""
+        cwd = os.getcwd()
+        os.chdir(self.tempdir.name)
+        try:
             return super().invoke(*args, **kwargs)
+        finally:
+            os.chdir(cwd)
 
     def test_read_file_first_func(self):
         """File reads fine."""
@@ -18,49 +18,44 @@ import codemetrics.scm as scm
 import tests.utils as utils
 
 
+# Parsed once at import, SimpleRepositoryFixture hands out copies.
+simple_log = utils.csvlog_to_dataframe(
+    textwrap.dedent(
+        """
+    revision,author,date,textmods,kind,action,propmods,path,message,added,removed
+    1016,elmotec,2018-02-26T10:28:00Z,true,file,M,false,stats.py,modified again,1,2
+    1018,elmotec,2018-02-24T11:14:11Z,true,file,M,false,stats.py,modified,3,4
+    1018,elmotec,2018-02-24T11:14:11Z,true,file,M,false,requirements.txt,modified,5,6"""
+    )
+)
+
+simple_files = pd.DataFrame(data={"path": ["stats.py", "requirements.txt"]})
+
+simple_loc = pd.DataFrame(
+    data={
+        "language": ["Python", "Unknown"],
+        "path": ["stats.py", "requirements.txt"],
+        "blank": [28, 0],
+        "comment": [84, 0],
+        "code": [100, 3],
+    }
+).astype({"language": "string", "path": "string"})
+
+
 class SimpleRepositoryFixture(utils.DataFrameTestCase):
     """Given a repository of a few records."""
 
     @staticmethod
     def get_log_df():
-        csv_data = textwrap.dedent(
-            """
-        revision,author,date,textmods,kind,action,propmods,path,message,added,removed
-        1016,elmotec,2018-02-26T10:28:00Z,true,file,M,false,stats.py,modified again,1,2
-        1018,elmotec,2018-02-24T11:14:11Z,true,file,M,false,stats.py,modified,3,4
-        1018,elmotec,2018-02-24T11:14:11Z,true,file,M,false,requirements.txt,modified,5,6"""
-        )
-        df = utils.csvlog_to_dataframe(csv_data)
-        return df
+        return simple_log.copy()
 
     @staticmethod
     def get_files_df():
-        return pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path
-        stats.py
-        requirements.txt
-        """
-                )
-            )
-        )
+        return simple_files.copy()
 
     @staticmethod
     def get_loc_df():
-        return pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        language,path,blank,comment,code
-        Python,stats.py,28,84,100
-        Unknown,requirements.txt,0,0,3
-        """
-                )
-            ),
-            dtype={"language": "string", "path": "string"},
-        )
+        return simple_loc.copy()
 
     def setUp(self):
         super().setUp()
@@ -72,32 +67,21 @@ class SimpleRepositoryFixture(utils.DataFrameTestCase):
 class GetMassChangesTestCase(SimpleRepositoryFixture):
     """Test non-report features."""
 
-    def setUp(self):
-        """Sets up tests"""
-        super().setUp()
-        self.log = SimpleRepositoryFixture.get_log_df()
-        self.expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-            revision,path,changes,changes_per_path
-            1016,1,3,3.0
-            1018,2,18,9.0
-            """
-                )
-            ),
-            dtype={
-                "revision": "string",
-                "path": "int64",
-                "changes": "float32",
-                "changes_per_path": "float64",
-            },
-        )
+    expected = pd.DataFrame(
+        data={
+            "revision": ["1016", "1018"],
+            "path": [1, 2],
+            "changes": [3.0, 18.0],
+            "changes_per_path": [3.0, 9.0],
+        }
+    ).astype({"revision": "string", "changes": "float32"})
+    expected_1016 = expected[expected["revision"] == "1016"]
+    expected_1018 = expected[expected["revision"] == "1018"]
 
     def test_get_mass_changes(self):
         """Retrieve mass changes easily."""
         actual = cm.get_mass_changes(self.log, min_path=2)
-        self.assertEqual(self.expected.query("revision == '1018'"), actual)
+        self.assertEqual(self.expected_1018, actual)
 
     def test_get_no_mass_changes(self):
         """Handles case where no mass changes are found."""
@@ -108,17 +92,21 @@ class GetMassChangesTestCase(SimpleRepositoryFixture):
         """The function works when the input log is indexed."""
         log = self.log.set_index(["revision", "path"])
         actual = cm.get_mass_changes(log, min_path=2)
-        self.assertEqual(self.expected.query("revision == '1018'"), actual)
+        self.assertEqual(self.expected_1018, actual)
 
     def test_get_mass_changes_on_changes_per_path(self):
         """Retrieve mass changes using changes_per_path."""
         actual = cm.get_mass_changes(self.log, max_changes_per_path=5.0)
-        self.assertEqual(self.expected.query("revision == '1016'"), actual)
+        self.assertEqual(self.expected_1016, actual)
 
 
 class AgeReportTestCase(SimpleRepositoryFixture):
     """Extends the repository scaffolding with an age report."""
 
+    expected = pd.DataFrame(
+        data={"path": ["requirements.txt", "stats.py"], "age": [3.531817, 1.563889]}
+    )
+
     def setUp(self):
         super().setUp()
         self.now = dt.datetime(2018, 2, 28, tzinfo=dt.timezone.utc)
@@ -126,12 +114,7 @@ class AgeReportTestCase(SimpleRepositoryFixture):
             "codemetrics.internals.get_now", autospec=True, return_value=self.now
         )
         self.get_now = self.get_now_patcher.start()
-        self.expected = pd.DataFrame(
-            data={"path": ["requirements.txt", "stats.py"], "age": [3.531817, 1.563889]}
-        )
-
-    def tearDown(self):
-        self.get_now_patcher.stop()
+        self.addCleanup(self.get_now_patcher.stop)
 
     def test_ages(self):
         """The age report generates data based on the SCM log data"""
@@ -145,20 +128,20 @@ class AgeReportTestCase(SimpleRepositoryFixture):
             self.expected.assign(kind="file").astype({"kind": "category"}), actual
         )
 
+    def test_ages_ignores_unused_categories(self):
+        """Categories absent from the log do not generate rows."""
+        log = self.log.astype({"kind": pd.CategoricalDtype(["dir", "file"])})
+        actual = cm.get_ages(log, by=["path", "kind"])[["path", "age", "kind"]]
+        expected = self.expected.assign(kind="file").astype({"kind": log["kind"].dtype})
+        self.assertEqual(expected, actual)
+
     def test_key_parameter(self):
         """Ignore files_df if nothing in it is relevant"""
-        self.log["component"] = "kernel"
-        actual = cm.get_ages(self.log, by=["component", "kind"])
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        component,kind,age
-        kernel,file,1.563889"""
-                )
-            ),
-            dtype={"kind": "category"},
-        )
+        log = self.log.assign(component="kernel")
+        actual = cm.get_ages(log, by=["component", "kind"])
+        expected = pd.DataFrame(
+            data={"component": ["kernel"], "kind": ["file"], "age": [1.563889]}
+        ).astype({"kind": "category"})
         self.assertEqual(expected, actual)
 
     def test_ages_when_revision_in_index(self):
@@ -170,20 +153,16 @@ class AgeReportTestCase(SimpleRepositoryFixture):
 class HotSpotReportTestCase(SimpleRepositoryFixture):
     """Extends the repository scaffolding with a hot spot report."""
 
-    def setUp(self):
-        super().setUp()
-        self.expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        language,path,blank,comment,lines,changes
-        Python,stats.py,28,84,100,1.0
-        Unknown,requirements.txt,0,0,3,0
-        """
-                )
-            ),
-            dtype={"language": "string", "changes": "Int64"},
-        )
+    expected = pd.DataFrame(
+        data={
+            "language": ["Python", "Unknown"],
+            "path": ["stats.py", "requirements.txt"],
+            "blank": [28, 0],
+            "comment": [84, 0],
+            "lines": [100, 3],
+            "changes": [1, 0],
+        }
+    ).astype({"language": "string", "changes": "Int64"})
 
     def test_hot_spot_report(self):
         """Generate a report to find hot spots."""
@@ -199,10 +178,11 @@ class HotSpotReportTestCase(SimpleRepositoryFixture):
         make sure the number of changes is 1 instead of 2.
 
         """
-        self.log["day"] = dt.datetime(2018, 2, 24, tzinfo=dt.timezone.utc)
-        actual = cm.get_hot_spots(self.log, self.loc, count_one_change_per=["day"])
-        self.expected.loc[1, "changes"] = 1  # from 2 changes.
-        self.assertEqual(self.expected, actual)
+        log = self.log.assign(day=dt.datetime(2018, 2, 24, tzinfo=dt.timezone.utc))
+        actual = cm.get_hot_spots(log, self.loc, count_one_change_per=["day"])
+        expected = self.expected.copy()
+        expected.loc[1, "changes"] = 1  # from 2 changes.
+        self.assertEqual(expected, actual)
 
     def test_hot_spot_with_na(self):
         """Generate a hot spot report with NA to make sure we don't try to assign 0.0"""
@@ -211,20 +191,18 @@ class HotSpotReportTestCase(SimpleRepositoryFixture):
         # not sure why the assign call turns path "string" dtype to "object".
         log = log.astype({"path": "string"})
         actual = cm.get_hot_spots(log, self.loc).query("path == 'other'")
-        expected = (
-            self.expected.append(
-                {
-                    "language": pd.NA,
-                    "path": "other",
-                    "blank": 0.0,
-                    "comment": 0.0,
-                    "lines": 0.0,
-                    "changes": 1,
-                },
-                ignore_index=True,
-            )
-            .astype({"language": "string"})
-            .query("path == 'other'")
+        other = pd.DataFrame(
+            data={
+                "language": [pd.NA],
+                "path": ["other"],
+                "blank": [0.0],
+                "comment": [0.0],
+                "lines": [0.0],
+                "changes": [1],
+            }
+        ).astype({"language": "string", "changes": "Int64"})
+        expected = pd.concat([self.expected, other], ignore_index=True).query(
+            "path == 'other'"
         )
         self.assertEqual(expected, actual)
 
@@ -232,44 +210,45 @@ class HotSpotReportTestCase(SimpleRepositoryFixture):
 class CoChangeTestCase(SimpleRepositoryFixture):
     """CoChangeReport test case."""
 
-    def setUp(self):
-        super().setUp()
-
     def test_co_change_report(self):
         """Simple CoChangeReport usage."""
-        actual = cm.get_co_changes(log=SimpleRepositoryFixture.get_log_df())
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path,dependency,changes,cochanges,coupling
-        requirements.txt,stats.py,1,1,1.0
-        stats.py,requirements.txt,2,1,0.5
-        """
-                )
-            )
+        actual = cm.get_co_changes(log=self.log)
+        expected = pd.DataFrame(
+            data={
+                "path": ["requirements.txt", "stats.py"],
+                "dependency": ["stats.py", "requirements.txt"],
+                "changes": [1, 2],
+                "cochanges": [1, 1],
+                "coupling": [1.0, 0.5],
+            }
         )
         self.assertEqual(expected, actual)
 
     def test_co_change_report_on_day(self):
         """Check handling of on with the date as a day in argument."""
-        log = SimpleRepositoryFixture.get_log_df()
         # Same day to force results different from test_co_change_report.
-        log["day"] = pd.to_datetime("2018-02-24")
+        log = self.log.assign(day=pd.to_datetime("2018-02-24"))
         actual = cm.get_co_changes(log=log, on="day")
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path,dependency,changes,cochanges,coupling
-        requirements.txt,stats.py,1,1,1.0
-        stats.py,requirements.txt,1,1,1.0
-        """
-                )
-            )
+        expected = pd.DataFrame(
+            data={
+                "path": ["requirements.txt", "stats.py"],
+                "dependency": ["stats.py", "requirements.txt"],
+                "changes": [1, 1],
+                "cochanges": [1, 1],
+                "coupling": [1.0, 1.0],
+            }
         )
         self.assertEqual(expected, actual)
 
+    def test_co_change_report_empty_log(self):
+        """Empty log gives an empty report with the usual columns."""
+        actual = cm.get_co_changes(log=self.log.head(0))
+        self.assertEqual(
+            ["path", "dependency", "changes", "cochanges", "coupling"],
+            list(actual.columns),
+        )
+        self.assertEqual(0, len(actual))
+
 
 code_maat_dataset = pd.read_csv(
     io.StringIO(
@@ -349,7 +328,7 @@ path,component
 ).fillna("")
 
 
-class ComponentTestCase(SimpleRepositoryFixture):
+class ComponentTestCase(utils.DataFrameTestCase):
     """Test guess_components function."""
 
     def setUp(self):
@@ -364,7 +343,7 @@ class ComponentTestCase(SimpleRepositoryFixture):
         actual = cm.guess_components(
             self.paths, stop_words={"code_maat"}, n_clusters=10
         )
-        actual = actual.sort_values(by="path").reset_index(drop=True)
+        actual = actual.sort_values(by="path", ignore_index=True)
         expected = code_maat_dataset
         self.assertEqual(expected, actual)
 
@@ -374,7 +353,7 @@ class ComponentTestCase(SimpleRepositoryFixture):
         comps = cm.guess_components(
             self.paths, stop_words={"code_maat"}, n_clusters=n_clusters
         )
-        actual = comps[["component"]].drop_duplicates().reset_index(drop=True)
+        actual = comps[["component"]].drop_duplicates(ignore_index=True)
         expected = pd.DataFrame(data={"component": ["parsers", "src.analysis", "test"]})
         self.assertEqual(expected, actual)
 
@@ -401,51 +380,60 @@ class GetComplexityTestCase(utils.DataFrameTestCase):
     """
     )
 
-    def setUp(self):
-        super().setUp()
-        self.log = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """\
-        revision,author,date,textmods,kind,action,propmods,path,message
-        r1,elmotec,2018-02-26T10:28:00Z,true,file,M,false,f.py,again
-        r2,elmotec,2018-02-24T11:14:11Z,true,file,M,false,f.py,modified"""
-                )
+    # Parsed once for the class, tests rebind rather than modify them.
+    log = pd.read_csv(
+        io.StringIO(
+            textwrap.dedent(
+                """\
+    revision,author,date,textmods,kind,action,propmods,path,message
+    r1,elmotec,2018-02-26T10:28:00Z,true,file,M,false,f.py,again
+    r2,elmotec,2018-02-24T11:14:11Z,true,file,M,false,f.py,modified"""
             )
         )
-        self.expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """\
-        revision,path,function,cyclomatic_complexity,nloc,token_count,name,long_name,start_line,end_line,top_nesting_level,length,fan_in,fan_out,general_fan_out,file_tokens,file_nloc
-        r1,f.py,0,2,4,16,test,test( ),1,4,0,4,0,0,0,17,4
-        r2,f.py,0,1,2,8,test,test( ),1,2,0,2,0,0,0,18,4
-        r2,f.py,1,1,2,8,other,other( ),4,5,0,2,0,0,0,18,4
-        """
-                )
-            ),
-            dtype={"name": "string", "long_name": "string"},
-        ).set_index(["revision", "path", "function"])
+    )
+    expected = pd.read_csv(
+        io.StringIO(
+            textwrap.dedent(
+                """\
+    revision,path,function,cyclomatic_complexity,nloc,token_count,name,long_name,start_line,end_line,top_nesting_level,length,fan_in,fan_out,general_fan_out,file_tokens,file_nloc
+    r1,f.py,0,2,4,16,test,test( ),1,4,0,4,0,0,0,17,4
+    r2,f.py,0,1,2,8,test,test( ),1,2,0,2,0,0,0,18,4
+    r2,f.py,1,1,2,8,other,other( ),4,5,0,2,0,0,0,18,4
+    """
+            )
+        ),
+        dtype={"name": "string", "long_name": "string"},
+    ).set_index(["revision", "path", "function"])
+
+    # Analysis of the log shared by the tests that need it, see get_complexity.
+    complexity = None
 
     def get_complexity(self):
-        """Factor retrieval of complexity"""
-        project = utils.FakeProject()
-        with mock.patch.object(
-            utils.FakeProject,
-            "download",
-            autospec=True,
-            side_effect=[
-                scm.DownloadResult("r1", "f.py", self.file_content_1),
-                scm.DownloadResult("r2", "f.py", self.file_content_2),
-            ],
-        ) as download:
-            df = self.log.groupby(["revision", "path"]).apply(
-                cm.get_complexity, project
-            )
-            self.assertEqual(
-                download.call_args_list, [mock.call(project, mock.ANY)] * 2
-            )
-        return df
+        """Factor retrieval of complexity.
+
+        The analysis runs on first use only and is kept for the class so that
+        tests which do not need it are not affected if it fails.
+
+        """
+        cls = type(self)
+        if cls.complexity is None:
+            project = utils.FakeProject()
+            with mock.patch.object(
+                utils.FakeProject,
+                "download",
+                autospec=True,
+                side_effect=[
+                    scm.DownloadResult("r1", "f.py", cls.file_content_1),
+                    scm.DownloadResult("r2", "f.py", cls.file_content_2),
+                ],
+            ) as download:
+                complexity = cls.log.groupby(["revision", "path"]).apply(
+                    cm.get_complexity, project
+                )
+            cls.project = project
+            cls.download_calls = download.call_args_list
+            cls.complexity = complexity
+        return cls.complexity
 
     @mock.patch(
         "lizard.auto_read", autospec=True, return_value=file_content_1, create=True
@@ -499,8 +487,10 @@ class GetComplexityTestCase(utils.DataFrameTestCase):
 
     def test_analysis_with_groupby_svn_download(self):
         """Check interface with svn."""
+        complexity = self.get_complexity()
+        self.assertEqual(self.download_calls, [mock.call(self.project, mock.ANY)] * 2)
         # Limit to the expected columns for resilience to new columns.
-        actual = self.get_complexity()[self.expected.columns]
+        actual = complexity[self.expected.columns]
         self.assertEqual(self.expected.T, actual.T)
 
     def test_complexity_name_dtype(self):
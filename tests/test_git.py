@@ -4,6 +4,7 @@
 """Tests for `codemetrics.git`"""
 
 import datetime as dt
+import io
 import pathlib as pl
 import textwrap
 import unittest
@@ -139,11 +140,11 @@ class GetGitLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
         """Prepare environment for the tests."""
         test_scm.GetLogTestCase.setUp(self, cm.git.GitProject(cwd=pl.Path("<root>")))
 
-    def tearDown(self):
-        """Clean up."""
-        mock.patch.stopall()
-
-    @mock.patch("codemetrics.internals.run", side_effect=[get_log()], autospec=True)
+    @mock.patch(
+        "codemetrics.internals.run_streaming",
+        side_effect=[get_log().split("\n")],
+        autospec=True,
+    )
     def test_git_arguments(self, run):
         """Check that git is called with the expected parameters."""
         self.project.get_log("file", after=self.after)
@@ -156,7 +157,11 @@ class GetGitLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
 
     # noinspection PyUnresolvedReferences,PyUnresolvedReferences,PyUnresolvedReferences
     @mock.patch("tqdm.tqdm", autospec=True, create=True)
-    @mock.patch("codemetrics.internals.run", side_effect=[get_log()], autospec=True)
+    @mock.patch(
+        "codemetrics.internals.run_streaming",
+        side_effect=[get_log().split("\n")],
+        autospec=True,
+    )
     def test_get_log_with_progress(self, _run, _):
         """Simple git call returns pandas.DataFrame."""
         pb = tqdm.tqdm()
@@ -173,10 +178,14 @@ class GetGitLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
         ]
         _run.assert_called_with(expected_cmd, cwd=pl.Path("<root>"))
         self.assertEqual(pb.total, 3)
-        pb.update.assert_has_calls([mock.call(1), mock.call(2)])
+        self.assertEqual([mock.call(1), mock.call(2)], pb.update.call_args_list)
         pb.close.assert_called_once()
 
-    @mock.patch("codemetrics.internals.run", side_effect=[get_log()], autospec=True)
+    @mock.patch(
+        "codemetrics.internals.run_streaming",
+        side_effect=[get_log().split("\n")],
+        autospec=True,
+    )
     def test_get_log(self, _):
         """Simple git call returns pandas.DataFrame."""
         actual = self.project.get_log(after=self.after)
@@ -196,14 +205,14 @@ b9fe5a6,elmotec,2018-12-04 21:49:55+00:00,tests/test_core.py,Added guess_compone
         self.assertEqual(expected, actual)
 
     @mock.patch(
-        "codemetrics.internals.run",
+        "codemetrics.internals.run_streaming",
         autospec=True,
         return_value=textwrap.dedent(
             """
                 [xxxxxxx] [elmotec] [2018-12-05 23:44:38 -0000] [excel file]
                 -       -       directory/output.xls
                 """
-        ),
+        ).split("\n"),
     )
     def test_handling_of_binary_files(self, _):
         """Handles binary files which do not show added or removed lines."""
@@ -218,14 +227,14 @@ b9fe5a6,elmotec,2018-12-04 21:49:55+00:00,tests/test_core.py,Added guess_compone
         self.assertEqual(expected, df)
 
     @mock.patch(
-        "codemetrics.internals.run",
+        "codemetrics.internals.run_streaming",
         autospec=True,
         return_value=textwrap.dedent(
             """
                 [xxxxxxx] [elmotec] [2018-12-05 23:44:38 -0000] [bbb [internals skip] [skipci]]
                 1       1       some/file
                 """
-        ),
+        ).split("\n"),
     )
     def test_handling_of_brackets_in_log(self, _):
         """Handles brackets inside the commit log."""
@@ -240,7 +249,7 @@ b9fe5a6,elmotec,2018-12-04 21:49:55+00:00,tests/test_core.py,Added guess_compone
         self.assertEqual(expected, df)
 
     @mock.patch(
-        "codemetrics.internals.run",
+        "codemetrics.internals.run_streaming",
         autospec=True,
         return_value=textwrap.dedent(
             """
@@ -248,7 +257,7 @@ b9fe5a6,elmotec,2018-12-04 21:49:55+00:00,tests/test_core.py,Added guess_compone
                 [1987486] [elmotec] [2019-01-25 07:04:31 -0500] [Change]
                 3       4       .gitignore
                 """
-        ),
+        ).split("\n"),
     )
     def test_empty_diff(self, _):
         """Handles log segment with no diffs."""
@@ -289,21 +298,8 @@ b9fe5a6,elmotec,2018-12-04 21:49:55+00:00,tests/test_core.py,Added guess_compone
 class GitDownloadTestCase(unittest.TestCase):
     """Test getting historical files with git."""
 
-    content1 = textwrap.dedent(
-        """
-    def main():
-        print('ahah!')
-    """
-    )
-    content2 = textwrap.dedent(
-        """
-    def main():
-        print('ahah!')
-
-    if __name__ == '__main__':
-        main()
-    """
-    )
+    content1 = test_scm.download_content1
+    content2 = test_scm.download_content2
 
     def setUp(self):
         super().setUp()
@@ -363,7 +359,7 @@ class GitDownloadTestCase(unittest.TestCase):
         self.assertEqual(expected, actual)
 
     @mock.patch("codemetrics.internals.check_run_in_root", autospec=True)
-    @mock.patch("codemetrics.internals.run", autospec=True)
+    @mock.patch("codemetrics.internals.run_streaming", autospec=True)
     def test_get_log_with_path(self, run, check_run_in_root) -> None:
         """get_log_func takes path into account."""
         after = dt.datetime(2018, 12, 3, tzinfo=dt.timezone.utc)
@@ -383,13 +379,114 @@ class GitDownloadTestCase(unittest.TestCase):
         )
 
 
+def cat_file_output(*objects: bytes) -> bytes:
+    """Format objects as git cat-file --batch would, None for missing ones."""
+    output = b""
+    for obj in objects:
+        if obj is None:
+            output += b"abc:missing.py missing\n"
+            continue
+        output += b"1234abcd blob %d\n%s\n" % (len(obj), obj)
+    return output
+
+
+class GitDownloadBatchTestCase(unittest.TestCase):
+    """Test getting several historical files with a single git process."""
+
+    content1 = test_scm.download_content1
+    content2 = test_scm.download_content2
+
+    def setUp(self):
+        super().setUp()
+        self.git_project = cm.git.GitProject()
+        self.sublog = pd.DataFrame(
+            data={"revision": ["r1", "r2"], "path": ["file.py"] * 2}
+        )
+        self.process = mock.MagicMock()
+        open_batch_patcher = mock.patch.object(
+            git._GitFileDownloader,
+            "_open_batch",
+            autospec=True,
+            return_value=self.process,
+        )
+        self.open_batch = open_batch_patcher.start()
+        self.addCleanup(open_batch_patcher.stop)
+
+    @mock.patch("codemetrics.internals.run", autospec=True)
+    def test_download_many_uses_one_process(self, run):
+        """All the files are read from the same git process."""
+        self.process.stdout = io.BytesIO(
+            cat_file_output(self.content1.encode(), self.content2.encode())
+        )
+        actual = self.git_project.download_many(self.sublog)
+        expected = [
+            cm.scm.DownloadResult("r1", "file.py", self.content1),
+            cm.scm.DownloadResult("r2", "file.py", self.content2),
+        ]
+        self.assertEqual(expected, actual)
+        self.open_batch.assert_called_once()
+        self.assertEqual(
+            [mock.call(b"r1:file.py\n"), mock.call(b"r2:file.py\n")],
+            self.process.stdin.write.call_args_list,
+        )
+        run.assert_not_called()
+
+    def test_download_many_converts_line_endings(self):
+        """Content is decoded like internals.run does."""
+        self.process.stdout = io.BytesIO(cat_file_output(b"a\r\nb\r\n", b""))
+        actual = self.git_project.download_many(self.sublog)
+        self.assertEqual(["a\nb\n", ""], [dr.content for dr in actual])
+
+    @mock.patch(
+        "codemetrics.internals.run",
+        autospec=True,
+        side_effect=[ValueError("failed to execute git show ...")],
+    )
+    def test_download_many_deleted_file(self, run):
+        """Files git cannot find are downloaded one by one to report the error."""
+        self.process.stdout = io.BytesIO(cat_file_output(self.content1.encode(), None))
+        actual = self.git_project.download_many(self.sublog)
+        expected = [
+            cm.scm.DownloadResult("r1", "file.py", self.content1),
+            cm.scm.DownloadResult("r2", "file.py", "failed to execute git show ..."),
+        ]
+        self.assertEqual(expected, actual)
+        run.assert_called_once_with(["git", "show", "r2:file.py"], cwd=pl.Path("."))
+
+    @mock.patch(
+        "codemetrics.internals.run",
+        autospec=True,
+        side_effect=ValueError("failed to execute git show ..."),
+    )
+    def test_download_many_when_git_exits(self, _):
+        """Files are downloaded one by one when the batch process is gone."""
+        # Like a pipe to a process that exited: writes fail and stdout is empty.
+        self.process.stdin.flush.side_effect = BrokenPipeError()
+        self.process.stdin.close.side_effect = BrokenPipeError()
+        self.process.stdout = io.BytesIO(b"")
+        actual = self.git_project.download_many(self.sublog)
+        expected = [
+            cm.scm.DownloadResult("r1", "file.py", "failed to execute git show ..."),
+            cm.scm.DownloadResult("r2", "file.py", "failed to execute git show ..."),
+        ]
+        self.assertEqual(expected, actual)
+
+
 class GitProjectTestCase(unittest.TestCase, test_scm.CommonProjectTestCase):
     """Test GitProject functionalities common to all projects."""
 
     Project = cm.git.GitProject
 
     def setUp(self):
-        pass
+        """Common tests mock internals.run: make download_many fall back on it."""
+        open_batch_patcher = mock.patch.object(
+            git._GitFileDownloader,
+            "_open_batch",
+            autospec=True,
+            side_effect=ValueError("failed to execute git cat-file --batch"),
+        )
+        open_batch_patcher.start()
+        self.addCleanup(open_batch_patcher.stop)
 
 
 if __name__ == "__main__":
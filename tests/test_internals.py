@@ -4,7 +4,9 @@
 """Test internals function."""
 
 import datetime as dt
+import os
 import subprocess
+import sys
 import tempfile
 import unittest
 from unittest import mock
@@ -114,6 +116,54 @@ class SubprocessRunTest(unittest.TestCase):
             errors="ignore",
         )
 
+    @unittest.skipUnless(os.environ.get("CM_INTEGRATION"), "set CM_INTEGRATION")
+    def test_actual_subprocess(self):
+        """internals.run returns the output of an actual process."""
+        actual = internals.run([sys.executable, "-c", "print('Hello world!')"])
+        self.assertEqual("Hello world!\n", actual)
+
+
+class SubprocessRunStreamingTest(unittest.TestCase):
+    """Test wrapper around subprocess.Popen yielding output lines."""
+
+    @mock.patch("subprocess.Popen", autospec=True)
+    def test_output_is_split_in_lines(self, popen):
+        """Lines are yielded without the trailing end of line."""
+        popen.return_value.stdout = ["first\n", "second\n"]
+        popen.return_value.returncode = 0
+        actual = list(internals.run_streaming(["some", "command"]))
+        self.assertEqual(["first", "second"], actual)
+
+    @mock.patch("subprocess.Popen", autospec=True)
+    def test_error_shows_in_exception(self, popen):
+        """internals.run_streaming raises ValueError when the command fails."""
+        popen.return_value.stdout = []
+        popen.return_value.returncode = 1
+        with self.assertRaises(ValueError) as context:
+            list(internals.run_streaming(["valid-command"]))
+        self.assertRegex(
+            str(context.exception), r"failed to execute valid-command \(in .*\)"
+        )
+
+    @mock.patch("subprocess.Popen", side_effect=FileNotFoundError())
+    def test_diagnostic_when_file_does_not_exist(self, _):
+        """internals.run_streaming raises ValueError if the command is not found."""
+        with self.assertRaises(ValueError) as context:
+            list(internals.run_streaming(["invalid-command"]))
+        self.assertRegex(
+            str(context.exception),
+            r"failed to execute invalid-command \(in .*\): file not found",
+        )
+
+    @unittest.skipUnless(os.environ.get("CM_INTEGRATION"), "set CM_INTEGRATION")
+    def test_actual_subprocess(self):
+        """internals.run_streaming returns stderr of an actual failed process."""
+        script = "import sys; print('Hello'); sys.exit('world!')"
+        lines = internals.run_streaming([sys.executable, "-c", script])
+        self.assertEqual("Hello", next(lines))
+        with self.assertRaisesRegex(ValueError, "world!"):
+            next(lines)
+
 
 class TestCheckRunInRoot(unittest.TestCase):
     """Test check_run_in_root function"""
@@ -39,23 +39,19 @@ class TestWordCountSpan(unittest.TestCase):
 class TestTokenCounts(unittest.TestCase):
     """Test ability to retrieve info about specific function."""
 
-    def setUp(self) -> None:
-        super().setUp()
-        self.input = io.StringIO(
-            textwrap.dedent(
-                """\
-        void foo() { innerfoo(); }
-
-        void bar(int v) {
-           v = v + 1;
-           if (v % 2)
-              return v + 1;
-           return v;
-        };
-        myfunc(2);
-        """
-            )
-        ).read()
+    input = textwrap.dedent(
+        """\
+    void foo() { innerfoo(); }
+
+    void bar(int v) {
+       v = v + 1;
+       if (v % 2)
+          return v + 1;
+       return v;
+    };
+    myfunc(2);
+    """
+    )
 
     def test_fluentcpp_sample(self) -> None:
         """Test fluentcpp sample."""
@@ -31,4 +31,4 @@ class ProgressBarAdapterTest(unittest.TestCase):
             pb.update(pb.now - dt.timedelta(3))
             pb.update(pb.now - dt.timedelta(1))
         expected = [mock.call(9), mock.call(2), mock.call(1)]
-        self.assertEqual(tqdm_().update.mock_calls, expected)
+        self.assertEqual(tqdm_.return_value.update.call_args_list, expected)
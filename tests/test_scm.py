@@ -15,6 +15,23 @@ import codemetrics as cm
 import codemetrics.scm as scm
 import tests.utils as utils
 
+# File contents shared by the download test cases of each SCM.
+download_content1 = textwrap.dedent(
+    """
+def main():
+    print('ahah!')
+"""
+)
+download_content2 = textwrap.dedent(
+    """
+def main():
+    print('ahah!')
+
+if __name__ == '__main__':
+    main()
+"""
+)
+
 
 class TestNormaliseLog(unittest.TestCase):
     """Given a scm.LogEntry data frame."""
@@ -163,6 +180,23 @@ class CommonProjectTestCase:
         expected = scm.DownloadResult("abcd", "/some/file", "dummy content")
         self.assertEqual(expected, actual)
 
+    @mock.patch(
+        "codemetrics.internals.run",
+        autospec=True,
+        side_effect=[download_content1, download_content2],
+    )
+    def test_download_many_returns_one_result_per_row(self, _):
+        """download_many returns the same results as download for each row."""
+        project = self.Project()
+        actual = project.download_many(
+            pd.DataFrame({"revision": ["r1", "r2"], "path": ["a.py", "b.py"]})
+        )
+        expected = [
+            scm.DownloadResult("r1", "a.py", download_content1),
+            scm.DownloadResult("r2", "b.py", download_content2),
+        ]
+        self.assertEqual(expected, actual)
+
     def test_project_constructor_takes_cwd_as_first_argument(self):
         """Project can be instanciated with cwd as first argument."""
         project = self.Project("/path/to/project")
@@ -212,10 +246,12 @@ class GetLogTestCase:
             "codemetrics.internals.get_now", autospec=True, return_value=self.now
         )
         self.get_now = self.get_now_patcher.start()
+        self.addCleanup(self.get_now_patcher.stop)
         self.get_check_patcher = mock.patch(
             "codemetrics.internals.check_run_in_root", autospec=True
         )
         self.check_run_in_root = self.get_check_patcher.start()
+        self.addCleanup(self.get_check_patcher.stop)
         self.after = dt.datetime(2018, 12, 3, tzinfo=dt.timezone.utc)
 
     def test_set_up_called(self) -> None:
@@ -49,6 +49,22 @@ def get_log(dates=None):
     return retval
 
 
+class ToDateTestCase(unittest.TestCase):
+    """Test conversion of svn dates."""
+
+    def test_svn_log_date(self):
+        """Dates from svn log --xml are converted to UTC datetimes."""
+        actual = cm.svn.to_date("2018-02-24T11:14:11.123456Z")
+        expected = dt.datetime(2018, 2, 24, 11, 14, 11, 123456, tzinfo=dt.timezone.utc)
+        self.assertEqual(expected, actual)
+
+    def test_other_date_format(self):
+        """Dates in other formats are still converted."""
+        actual = cm.svn.to_date("2018-02-24 11:14:11")
+        expected = dt.datetime(2018, 2, 24, 11, 14, 11, tzinfo=dt.timezone.utc)
+        self.assertEqual(expected, actual)
+
+
 class SubversionLogCollectorInitializationTestCase(unittest.TestCase):
     """Test initialization of _SvnLogCollector.
 
@@ -89,9 +105,6 @@ class GetSvnLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
         """Calls parent GetLogTestCase.setUp."""
         test_scm.GetLogTestCase.setUp(self, cm.svn.SvnProject("<root>"))
 
-    def tearDown(self):
-        mock.patch.stopall()
-
     @mock.patch(
         "pathlib.Path.glob", autospec=True, side_effect=[["start_line.py", "second.py"]]
     )
@@ -99,18 +112,8 @@ class GetSvnLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
         """get_files return the list of files."""
         actual = cm.internals.get_files(pattern="*.py")
         glob.assert_called_with(mock.ANY, "*.py")
-        actual = actual.sort_values(by="path").reset_index(drop=True)
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path
-        second.py
-        start_line.py
-        """
-                )
-            )
-        )
+        actual = actual.sort_values(by="path", ignore_index=True)
+        expected = pd.DataFrame(data={"path": ["second.py", "start_line.py"]})
         self.assertEqual(actual, expected)
 
     @mock.patch("codemetrics.internals.run", side_effect=[get_log()], autospec=True)
@@ -147,8 +150,8 @@ class GetSvnLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
             after=self.after, progress_bar=progress_bar, relative_url="/project/trunk"
         )
         self.assertEqual(progress_bar.total, 3)
-        calls = [mock.call(1), mock.call(2)]
-        progress_bar.update.assert_has_calls(calls)
+        calls = [mock.call(1), mock.call(2), mock.call(0)]
+        self.assertEqual(calls, progress_bar.update.call_args_list)
         progress_bar.close.assert_called_once()
 
     @mock.patch(
@@ -182,6 +185,31 @@ class GetSvnLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
         )
         self.assertEqual(expected, df)
 
+    @mock.patch(
+        "codemetrics.internals.run",
+        side_effect=[
+            textwrap.dedent(
+                """
+    <?xml version="1.0" encoding="UTF-8"?>
+    <log>
+    <logentry revision="1018">
+    <author>elmotec</author>
+    <date>2018-02-24T11:14:11.000000Z</date>
+    <paths><path text-mods="true" kind="file" action="M"
+        prop-mods="false">stats.py</path></paths>
+    <msg>first line
+    second line</msg>
+    </logentry>
+    </log>"""
+            )
+        ],
+        autospec=True,
+    )
+    def test_get_log_multiline_msg(self, _):
+        """Lines of the message are separated by a space."""
+        df = self.project.get_log(after=self.after, relative_url="/project/trunk")
+        self.assertEqual(["first line second line"], df["message"].tolist())
+
     @mock.patch(
         "codemetrics.internals.run",
         side_effect=[
@@ -276,21 +304,8 @@ class GetSvnLogTestCase(unittest.TestCase, test_scm.GetLogTestCase):
 class SubversionDownloadTestCase(unittest.TestCase):
     """Test getting historical files with subversion."""
 
-    content1 = textwrap.dedent(
-        """
-    def main():
-        print('ahah!')
-    """
-    )
-    content2 = textwrap.dedent(
-        """
-    def main():
-        print('ahah!')
-
-    if __name__ == '__main__':
-        main()
-    """
-    )
+    content1 = test_scm.download_content1
+    content2 = test_scm.download_content2
 
     def setUp(self):
         self.svn = cm.svn.SvnDownloader("cat -r".split())
@@ -406,6 +421,69 @@ class SubversionGetDiffStatsTestCase(utils.DataFrameTestCase):
     '''
     )
 
+    empty_diff = textwrap.dedent(
+        """
+    Index: connect_jupyter_on_desktop1.sh
+    ===================================================================
+    diff --git a/estimate/connect_jupyter_on_desktop1.sh b/estimate/connect_jupyter_on_desktop1.sh
+    new file mode 100644
+    --- a/estimate/connect_jupyter_on_desktop1.sh   (nonexistent)
+    +++ b/estimate/connect_jupyter_on_desktop1.sh   (revision 899)
+    """
+    )
+
+    single_line_diff = textwrap.dedent(
+        """
+    Index: connect_jupyter_on_desktop1.sh
+    ===================================================================
+    diff --git a/estimate/connect_jupyter_on_desktop1.sh b/estimate/connect_jupyter_on_desktop1.sh
+    new file mode 100644
+    --- a/estimate/connect_jupyter_on_desktop1.sh   (nonexistent)
+    +++ b/estimate/connect_jupyter_on_desktop1.sh   (revision 899)
+    @@ -0,0 +1 @@
+    +ssh -NL 8888:localhost:8888 elmotec@desktop1
+    """
+    )
+
+    spaces_in_name_diff = textwrap.dedent(
+        """
+    Index: contrib/file with spaces.py
+    ===================================================================
+    diff --git a/dir/contrib/file.py b/dir/contrib/file.py
+    new file mode 100644
+    --- a/estimate/contrib/file with spaces.py        (nonexistent)
+    +++ b/estimate/contrib/file with spaces.py        (revision 756)
+    @@ -0,0 +1,1 @@
+    +#!/usr/bin/env python
+    """
+    )
+
+    deleted_file_diff = textwrap.dedent(
+        """
+    Index: alembic-prod.ini
+    ===================================================================
+    diff --git a/estimate/alembic-prod.ini b/estimate/alembic-prod.ini
+    deleted file mode 100644
+    --- a/estimate/alembic-prod.ini (revision 1035)
+    +++ b/estimate/alembic-prod.ini (nonexistent)
+    @@ -1,50 +0,0 @@
+    -# A generic, single database configuration.
+    -
+    """
+    )
+
+    branch_diff = textwrap.dedent(
+        """
+    Index: somedir/file.py
+    ===================================================================
+    diff --git a/project/branches/somedir/file.txt b/project/branches/somedir/file.txt
+    --- a/project/branches/somedir/file.py       (revision 1234)
+    +++ b/project/branches/somedir/file.py       (revision 1235)
+    @@ -0,0 +1,1 @@
+    +#!/usr/bin/env python
+    """
+    )
+
     log = pd.read_csv(
         io.StringIO(
             textwrap.dedent(
@@ -436,38 +514,46 @@ class SubversionGetDiffStatsTestCase(utils.DataFrameTestCase):
         dtype={"revision": "str", "path": "str"},
     )
 
-    @mock.patch("codemetrics.internals.run", autospec=True, return_value=diffs)
-    def test_called_command_line(self, run_):
+    def setUp(self):
+        """Mocks the internal run command to return the diffs."""
+        super().setUp()
+        self.run_patcher = mock.patch(
+            "codemetrics.internals.run", autospec=True, return_value=self.diffs
+        )
+        self.run_ = self.run_patcher.start()
+        self.addCleanup(self.run_patcher.stop)
+
+    def test_called_command_line(self):
         """Can retrieve chunk statistics from Subversion"""
         cm.svn.get_diff_stats(self.log, cwd="<root>")
-        run_.assert_called_once_with("svn diff --git -c 1014 .".split(), cwd="<root>")
+        self.run_.assert_called_once_with(
+            "svn diff --git -c 1014 .".split(), cwd="<root>"
+        )
 
-    @mock.patch("codemetrics.internals.run", autospec=True, return_value=diffs)
-    def test_direct_call(self, _):
+    def test_direct_call(self):
         """Direct call to cm.svn.get_diff_stats"""
         actual = cm.svn.get_diff_stats(self.log)
         expected = self.expected.drop(columns=["revision"]).set_index(["path", "chunk"])
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True, return_value=diffs)
-    def test_direct_call_with_indexed_data(self, _):
+    def test_direct_call_with_indexed_data(self):
         """Direct call to cm.svn.get_diff_stats"""
         actual = cm.svn.get_diff_stats(self.log.set_index(["revision", "path"]))
         expected = self.expected.drop(columns=["revision"]).set_index(["path", "chunk"])
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True, side_effect=[diffs, diffs])
-    def test_get_chunk_stats_with_groupby_apply(self, _):
+    def test_get_chunk_stats_with_groupby_apply(self):
         """Can retrieve chunk statistics from Subversion"""
+        self.run_.side_effect = [self.diffs, self.diffs]
         actual = self.log.groupby(["revision"]).apply(cm.svn.get_diff_stats)
         expected = self.expected.reset_index(drop=True).set_index(
             ["revision", "path", "chunk"]
         )
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True, side_effect=[diffs, diffs])
-    def test_get_stats_with_groupby_apply(self, _):
+    def test_get_stats_with_groupby_apply(self):
         """Can retrieve chunk statistics from Subversion"""
+        self.run_.side_effect = [self.diffs, self.diffs]
         actual = self.log.groupby(["revision"]).apply(
             cm.svn.get_diff_stats, chunks=False
         )
@@ -478,11 +564,10 @@ class SubversionGetDiffStatsTestCase(utils.DataFrameTestCase):
         )
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True)
-    def test_error_generates_warning(self, run_):
+    def test_error_generates_warning(self):
         """Can retrieve chunk statistics from Subversion"""
         exception = subprocess.CalledProcessError(1, cmd="svn", stderr="some error")
-        run_.side_effect = [exception] * 2
+        self.run_.side_effect = [exception] * 2
         with self.assertLogs(level="WARN") as context:
             cm.svn.get_diff_stats(self.log)
         expected = (
@@ -491,151 +576,83 @@ class SubversionGetDiffStatsTestCase(utils.DataFrameTestCase):
         )
         self.assertEqual([expected], context.output)
 
-    @mock.patch("codemetrics.internals.run", autospec=True)
-    def test_empty_diff(self, run):
+    def test_empty_diff(self):
         """Direct call when svn returns an empty data frame"""
-        run.return_value = textwrap.dedent(
-            """
-        Index: connect_jupyter_on_desktop1.sh
-        ===================================================================
-        diff --git a/estimate/connect_jupyter_on_desktop1.sh b/estimate/connect_jupyter_on_desktop1.sh
-        new file mode 100644
-        --- a/estimate/connect_jupyter_on_desktop1.sh   (nonexistent)
-        +++ b/estimate/connect_jupyter_on_desktop1.sh   (revision 899)
-        """
-        )
+        self.run_.return_value = self.empty_diff
         actual = cm.svn.get_diff_stats(self.log)
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path,chunk,first,last,added,removed
-        """
-                )
-            ),
-            index_col=["path", "chunk"],
+        columns = ["path", "chunk", "first", "last", "added", "removed"]
+        expected = pd.DataFrame(columns=columns, dtype="object").set_index(
+            ["path", "chunk"]
         )
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True)
-    def test_single_diff_line(self, run):
+    def test_single_diff_line(self):
         """Direct call to cm.svn.get_diff_stats when svn returns single line"""
-        run.return_value = textwrap.dedent(
-            """
-        Index: connect_jupyter_on_desktop1.sh
-        ===================================================================
-        diff --git a/estimate/connect_jupyter_on_desktop1.sh b/estimate/connect_jupyter_on_desktop1.sh
-        new file mode 100644
-        --- a/estimate/connect_jupyter_on_desktop1.sh   (nonexistent)
-        +++ b/estimate/connect_jupyter_on_desktop1.sh   (revision 899)
-        @@ -0,0 +1 @@
-        +ssh -NL 8888:localhost:8888 elmotec@desktop1
-        """
-        )
+        self.run_.return_value = self.single_line_diff
         actual = cm.svn.get_diff_stats(self.log)
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path,chunk,first,last,added,removed
-        connect_jupyter_on_desktop1.sh,0,1,1,1,0
-        """
-                )
-            ),
-            index_col=["path", "chunk"],
-        )
+        expected = pd.DataFrame(
+            data={
+                "path": ["connect_jupyter_on_desktop1.sh"],
+                "chunk": [0],
+                "first": [1],
+                "last": [1],
+                "added": [1],
+                "removed": [0],
+            }
+        ).set_index(["path", "chunk"])
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True)
-    def test_handle_files_with_spaces_in_name(self, run):
+    def test_handle_files_with_spaces_in_name(self):
         """Files that have spaces in the name are handled correctly."""
-        run.return_value = textwrap.dedent(
-            """
-        Index: contrib/file with spaces.py
-        ===================================================================
-        diff --git a/dir/contrib/file.py b/dir/contrib/file.py
-        new file mode 100644
-        --- a/estimate/contrib/file with spaces.py        (nonexistent)
-        +++ b/estimate/contrib/file with spaces.py        (revision 756)
-        @@ -0,0 +1,1 @@
-        +#!/usr/bin/env python
-        """
-        )
+        self.run_.return_value = self.spaces_in_name_diff
         actual = cm.svn.get_diff_stats(self.log)
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path,chunk,first,last,added,removed
-        contrib/file with spaces.py,0,1,2,1,0
-        """
-                )
-            ),
-            index_col=["path", "chunk"],
-        )
+        expected = pd.DataFrame(
+            data={
+                "path": ["contrib/file with spaces.py"],
+                "chunk": [0],
+                "first": [1],
+                "last": [2],
+                "added": [1],
+                "removed": [0],
+            }
+        ).set_index(["path", "chunk"])
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True)
-    def test_deleted_files(self, run):
+    def test_deleted_files(self):
         """Files that were deleted."""
-        run.return_value = textwrap.dedent(
-            """
-        Index: alembic-prod.ini
-        ===================================================================
-        diff --git a/estimate/alembic-prod.ini b/estimate/alembic-prod.ini
-        deleted file mode 100644
-        --- a/estimate/alembic-prod.ini (revision 1035)
-        +++ b/estimate/alembic-prod.ini (nonexistent)
-        @@ -1,50 +0,0 @@
-        -# A generic, single database configuration.
-        -
-        """
-        )
+        self.run_.return_value = self.deleted_file_diff
         actual = cm.svn.get_diff_stats(self.log)
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path,chunk,first,last,added,removed
-        alembic-prod.ini,0,0,0,0,2
-        """
-                )
-            ),
-            index_col=["path", "chunk"],
-        )
+        expected = pd.DataFrame(
+            data={
+                "path": ["alembic-prod.ini"],
+                "chunk": [0],
+                "first": [0],
+                "last": [0],
+                "added": [0],
+                "removed": [2],
+            }
+        ).set_index(["path", "chunk"])
         self.assertEqual(expected, actual)
 
-    @mock.patch("codemetrics.internals.run", autospec=True)
-    def test_use_index_to_id_file_in_branches(self, run):
+    def test_use_index_to_id_file_in_branches(self):
         """Handles a weird bug in Subversion
 
         Branch name is dropped with --git option in the diff command. So we
         must rely on the Index: line above. It seems simpler anyway.
 
         """
-        run.return_value = textwrap.dedent(
-            """
-        Index: somedir/file.py
-        ===================================================================
-        diff --git a/project/branches/somedir/file.txt b/project/branches/somedir/file.txt
-        --- a/project/branches/somedir/file.py       (revision 1234)
-        +++ b/project/branches/somedir/file.py       (revision 1235)
-        @@ -0,0 +1,1 @@
-        +#!/usr/bin/env python
-        """
-        )
+        self.run_.return_value = self.branch_diff
         actual = cm.svn.get_diff_stats(self.log)
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    """
-        path,chunk,first,last,added,removed
-        somedir/file.py,0,1,2,1,0
-        """
-                )
-            ),
-            index_col=["path", "chunk"],
-        )
+        expected = pd.DataFrame(
+            data={
+                "path": ["somedir/file.py"],
+                "chunk": [0],
+                "first": [1],
+                "last": [2],
+                "added": [1],
+                "removed": [0],
+            }
+        ).set_index(["path", "chunk"])
         self.assertEqual(expected, actual)
 
 
@@ -2,35 +2,67 @@
 # -*- coding: utf-8 -*-
 
 import io
+import json
 import sys
 import textwrap
 import unittest
+import unittest.mock as mock
 
+import numpy as np
 import pandas as pd
 
 from codemetrics import vega
 from tests.utils import DataFrameTestCase
 
 
+def expected_path_hierarchy(sep):
+    """Hierarchy of the paths in BuildHierarchyTest using sep as path separator."""
+    paths = [
+        "",
+        "doc",
+        "pandas",
+        "doc/source",
+        "pandas/io",
+        "pandas/tests",
+        "pandas/tests/io",
+        "doc/source/_static",
+        "pandas/tests/io/data",
+        "pandas/io/pytables.py",
+        "pandas/tests/test_window.py",
+        "pandas/tests/io/test_pytables.py",
+        "doc/source/_static/banklist.html",
+        "pandas/tests/io/data/banklist.html",
+    ]
+    return pd.DataFrame(
+        {
+            "id": range(len(paths)),
+            "parent": [np.nan, 0, 0, 1, 2, 2, 5, 3, 6, 4, 5, 6, 7, 8],
+            "path": pd.Series([p.replace("/", sep) for p in paths], dtype="object"),
+        }
+    )
+
+
 class BuildHierarchyTest(DataFrameTestCase):
     """Tests function for build_hierarchy function."""
 
+    data = pd.read_csv(
+        io.StringIO(
+            textwrap.dedent(
+                r"""
+    path,lines,changes
+    pandas\tests\io\data\banklist.html,4832,2.0
+    doc\source\_static\banklist.html,4831,1.0
+    pandas\tests\io\test_pytables.py,3961,27.0
+    pandas\tests\test_window.py,2970,19.0
+    pandas\io\pytables.py,2960,36.0"""
+            )
+        )
+    )
+
     def setUp(self):
         """Set up the test case."""
         super().setUp()
-        self.input_df = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    r"""
-        path,lines,changes
-        pandas\tests\io\data\banklist.html,4832,2.0
-        doc\source\_static\banklist.html,4831,1.0
-        pandas\tests\io\test_pytables.py,3961,27.0
-        pandas\tests\test_window.py,2970,19.0
-        pandas\io\pytables.py,2960,36.0"""
-                )
-            )
-        )
+        self.input_df = self.data.copy()
 
     def test_input_does_not_change(self):
         """Make sure the input does not get modified."""
@@ -42,30 +74,7 @@ class BuildHierarchyTest(DataFrameTestCase):
     def test_path_hierarchy(self):
         """Main case where we build a hierarchy of paths"""
         actual = vega.build_hierarchy(self.input_df[["path"]])
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    r"""
-        id,parent,path
-        0,,
-        1,0,doc
-        2,0,pandas
-        3,1,doc\source
-        4,2,pandas\io
-        5,2,pandas\tests
-        6,5,pandas\tests\io
-        7,3,doc\source\_static
-        8,6,pandas\tests\io\data
-        9,4,pandas\io\pytables.py
-        10,5,pandas\tests\test_window.py
-        11,6,pandas\tests\io\test_pytables.py
-        12,7,doc\source\_static\banklist.html
-        13,8,pandas\tests\io\data\banklist.html"""
-                )
-            ),
-            dtype={"id": "int64", "parent": "float", "path": "object"},
-        )
-        expected.loc[expected["path"].isnull(), "path"] = ""
+        expected = expected_path_hierarchy(sep="\\")
         self.assertEqual(expected, actual)
 
     def test_unix_path_hierarchy(self):
@@ -77,32 +86,28 @@ class BuildHierarchyTest(DataFrameTestCase):
             .to_frame("path"),
             root="",
         )
-        expected = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    r"""
-        id,parent,path
-        0,,
-        1,0,doc
-        2,0,pandas
-        3,1,doc/source
-        4,2,pandas/io
-        5,2,pandas/tests
-        6,5,pandas/tests/io
-        7,3,doc/source/_static
-        8,6,pandas/tests/io/data
-        9,4,pandas/io/pytables.py
-        10,5,pandas/tests/test_window.py
-        11,6,pandas/tests/io/test_pytables.py
-        12,7,doc/source/_static/banklist.html
-        13,8,pandas/tests/io/data/banklist.html"""
-                )
-            ),
-            dtype={"id": "int64", "parent": "float", "path": "object"},
+        expected = expected_path_hierarchy(sep="/")
+        self.assertEqual(expected, actual)
+
+    def test_flat_hierarchy(self):
+        """Elements without parent other than the root all hang off the root."""
+        data = pd.DataFrame({"path": ["setup.py", "README.rst", "tox.ini"]})
+        actual = vega.build_hierarchy(data)
+        expected = pd.DataFrame(
+            {
+                "id": [0, 1, 2, 3],
+                "parent": [np.nan, 0.0, 0.0, 0.0],
+                "path": ["", "tox.ini", "README.rst", "setup.py"],
+            }
         )
-        expected.loc[expected["path"].isnull(), "path"] = ""
         self.assertEqual(expected, actual)
 
+    def test_empty_input(self):
+        """Empty input does not reach the root."""
+        with self.assertRaises(ValueError) as context:
+            vega.build_hierarchy(self.input_df.head(0))
+        self.assertIn("cannot find root", str(context.exception))
+
     def test_root_not_found(self):
         """Get a decent diagnostic when the root is not found."""
         with self.assertRaises(ValueError) as context:
@@ -111,22 +116,24 @@ class BuildHierarchyTest(DataFrameTestCase):
 
 
 class TestHotSpots(DataFrameTestCase):
+    data = pd.read_csv(
+        io.StringIO(
+            textwrap.dedent(
+                r"""
+    path,lines,changes
+    pandas/tests/io/data/banklist.html,4832,2.0
+    doc/source/_static/banklist.html,4831,1.0
+    pandas/tests/io/test_pytables.py,3961,27.0
+    pandas/tests/test_window.py,2970,19.0
+    pandas/io/pytables.py,2960,36.0"""
+            )
+        )
+    )
+
     def setUp(self):
         """Set up the test case."""
         super().setUp()
-        self.df = pd.read_csv(
-            io.StringIO(
-                textwrap.dedent(
-                    r"""
-        path,lines,changes
-        pandas/tests/io/data/banklist.html,4832,2.0
-        doc/source/_static/banklist.html,4831,1.0
-        pandas/tests/io/test_pytables.py,3961,27.0
-        pandas/tests/test_window.py,2970,19.0
-        pandas/io/pytables.py,2960,36.0"""
-                )
-            )
-        )
+        self.df = self.data.copy()
 
     def test_vis_hot_spots(self):
         """Test conversion of get_hot_spots data frame to vega visualization."""
@@ -256,8 +263,34 @@ class TestHotSpots(DataFrameTestCase):
         }
         self.assertEqual(expected, actual)
 
+    def test_vis_hot_spots_is_json_serializable(self):
+        """Additional columns like dates do not prevent serialization to json."""
+        df = self.df.assign(date=pd.Timestamp("2021-01-01", tz="UTC"))
+        actual = vega.vis_hot_spots(df)
+        self.assertIsInstance(json.dumps(actual), str)
+
+    def test_vis_hot_spots_reuses_hierarchy(self):
+        """A hierarchy built by the caller is used as is."""
+        hierarchy = vega.build_hierarchy(self.df[["path"]])
+        expected = hierarchy.copy()
+        first = vega.vis_hot_spots(self.df)
+        with mock.patch.object(vega, "build_hierarchy", autospec=True) as build:
+            second = vega.vis_hot_spots(self.df, width=600, hierarchy=hierarchy)
+        build.assert_not_called()
+        self.assertEqual(first["data"], second["data"])
+        self.assertEqual(expected, hierarchy)
+
     def test_empty_frame_generates_error(self):
         """Test that an empty frame generate an error."""
         with self.assertRaises(ValueError) as context:
             _ = vega.vis_hot_spots(self.df.head(0))
             self.assertIn("empty", str(context.exception))
+
+    def test_vis_ages_input_does_not_change(self):
+        """Make sure vis_ages does not modify its input."""
+        ages = self.df.rename(columns={"lines": "code", "changes": "age"})
+        backup = ages.copy()
+        actual = vega.vis_ages(ages)
+        self.assertEqual(backup, ages)
+        days = {v["path"]: v["intensity"] for v in actual["data"][0]["values"]}
+        self.assertEqual(36, days["pandas/io/pytables.py"])
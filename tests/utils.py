@@ -17,8 +17,19 @@ import codemetrics.scm as scm
 def add_data_frame_equality_func(test):
     """Define test class to handle assertEqual with `pandas.DataFrame`."""
 
+    def identical(lhs, rhs):
+        """Cheap check that lhs and rhs have the same axes, dtypes and values."""
+        try:
+            pdt.assert_index_equal(lhs.columns, rhs.columns)
+            pdt.assert_index_equal(lhs.index, rhs.index)
+        except AssertionError:
+            return False
+        return lhs.dtypes.equals(rhs.dtypes) and lhs.equals(rhs)
+
     def frame_equal(lhs, rhs, msg=None):
         """Adapter for pandas.testing.assert_frame_equal."""
+        if identical(lhs, rhs):
+            return
         try:
             pdt.assert_frame_equal(lhs, rhs, check_categorical=False)
         except AssertionError as err:
@@ -58,8 +69,8 @@ def csvlog_to_dataframe(csv_log: str) -> pd.DataFrame:
 
     Columns are expected to match the fields of the type `scm.LogEntry`.
 
-    Leverages pandas.read_csv. Also fixes the type of 'date' column to be
-    a datet/time in UTC tz.
+    Leverages pandas.read_csv. The 'date' column is left as text for
+    `scm.normalize_log` to convert to a date/time in UTC tz in one pass.
 
     Args:
         csv_log: csv representation of fields of `scm.LogEntry`
@@ -72,7 +83,6 @@ def csvlog_to_dataframe(csv_log: str) -> pd.DataFrame:
             "textmods": "bool",
             "propmods": "bool",
         },
-        parse_dates=["date"],
         false_values=["", "False", "0"],
     )
     # Adds missing columns w/ default None.